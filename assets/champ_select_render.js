@@ -0,0 +1,224 @@
+// Champion select renderer shared by the main page and the render benchmark.
+//
+// Slot elements are created once and cached. Incoming states are coalesced
+// and applied once per animation frame, writing only the ban and pick slots
+// whose value differs from what is already on screen. Notifications raised
+// before a frame are merged per message into a single reused element, and
+// ones older than their display time (e.g. from a background tab, where
+// frames are paused) are dropped.
+(function (global) {
+    const MAX_BANS = 10;
+    const TEAM_SIZE = 5;
+    const TEAMS = ['blue', 'red'];
+    const ROLES = ['TOP', 'JGL', 'MID', 'ADC', 'SUP'];
+    const NOTIFICATION_DURATION = 3000;
+
+    function createChampSelectRenderer(options) {
+        const getChampionName = options.getChampionName;
+        const schedule = options.schedule || (callback => global.requestAnimationFrame(callback));
+
+        // Cached slot elements and the values currently rendered in them
+        const banSlots = [];
+        const renderedBans = new Array(MAX_BANS).fill(null);
+        const pickSlots = [[], []];
+        const renderedPicks = [[], []];
+
+        let pendingState = null;
+        // Pending notifications keyed by message: { type, count, time }
+        let pendingNotifications = new Map();
+        let frameRequested = false;
+        let initialized = false;
+        let notificationElement = null;
+        let notificationTimer = null;
+
+        function initializeBansGrid(bansGrid) {
+            const fragment = document.createDocumentFragment();
+
+            for (let i = 0; i < MAX_BANS; i++) {
+                const banSlot = document.createElement('div');
+                banSlot.className = 'ban-slot';
+                banSlot.id = `ban-${i}`;
+                banSlot.textContent = `Ban ${i + 1}`;
+                fragment.appendChild(banSlot);
+                banSlots[i] = banSlot;
+                renderedBans[i] = null;
+            }
+
+            bansGrid.innerHTML = '';
+            bansGrid.appendChild(fragment);
+        }
+
+        function initializeTeams(teamContainers) {
+            for (let team = 0; team < 2; team++) {
+                const fragment = document.createDocumentFragment();
+
+                for (let slot = 0; slot < TEAM_SIZE; slot++) {
+                    const pickSlot = document.createElement('div');
+                    pickSlot.className = 'champion-slot';
+                    pickSlot.id = `${TEAMS[team]}-${slot}`;
+
+                    const roleElement = document.createElement('div');
+                    roleElement.className = 'champion-role';
+                    roleElement.textContent = ROLES[slot];
+
+                    const nameElement = document.createElement('div');
+                    nameElement.className = 'champion-name';
+                    nameElement.textContent = '-';
+
+                    pickSlot.appendChild(roleElement);
+                    pickSlot.appendChild(nameElement);
+                    fragment.appendChild(pickSlot);
+
+                    pickSlots[team][slot] = { slot: pickSlot, role: roleElement, name: nameElement };
+                    renderedPicks[team][slot] = { champion_id: null, role: null };
+                }
+
+                teamContainers[team].innerHTML = '';
+                teamContainers[team].appendChild(fragment);
+            }
+        }
+
+        function initialize(elements) {
+            initializeBansGrid(elements.bansGrid);
+            initializeTeams([elements.blueTeam, elements.redTeam]);
+
+            notificationElement = document.createElement('div');
+            notificationElement.className = 'notification';
+            document.body.appendChild(notificationElement);
+
+            // Anything queued before initialization is applied on the next frame
+            initialized = true;
+            if (pendingState || pendingNotifications.size > 0) {
+                requestFrame();
+            }
+        }
+
+        function requestFrame() {
+            if (!frameRequested) {
+                frameRequested = true;
+                schedule(flush);
+            }
+        }
+
+        // Queue a champion select state; only the latest state per frame is rendered
+        function render(champSelectData) {
+            pendingState = champSelectData;
+            requestFrame();
+        }
+
+        // Queue a notification; repeats of a message before the next frame are merged
+        function notify(message, type = 'info') {
+            const pending = pendingNotifications.get(message);
+            if (pending) {
+                pending.type = type;
+                pending.count++;
+                pending.time = Date.now();
+            } else {
+                pendingNotifications.set(message, { type: type, count: 1, time: Date.now() });
+            }
+            requestFrame();
+        }
+
+        function applyBans(bans) {
+            for (let i = 0; i < MAX_BANS; i++) {
+                const championId = bans[i] || null;
+                if (championId === renderedBans[i]) {
+                    continue;
+                }
+
+                const banSlot = banSlots[i];
+                if (championId) {
+                    banSlot.textContent = getChampionName(championId);
+                    banSlot.classList.add('filled');
+                } else {
+                    banSlot.textContent = `Ban ${i + 1}`;
+                    banSlot.classList.remove('filled');
+                }
+                renderedBans[i] = championId;
+            }
+        }
+
+        function applyPicks(picks) {
+            for (let team = 0; team < 2; team++) {
+                for (let slot = 0; slot < TEAM_SIZE; slot++) {
+                    const pick = picks[team][slot];
+                    const rendered = renderedPicks[team][slot];
+                    const elements = pickSlots[team][slot];
+                    const championId = pick.champion_id || null;
+
+                    if (championId !== rendered.champion_id) {
+                        if (championId) {
+                            elements.name.textContent = getChampionName(championId);
+                            elements.slot.classList.add('filled');
+                        } else {
+                            elements.name.textContent = '-';
+                            elements.slot.classList.remove('filled');
+                        }
+                        rendered.champion_id = championId;
+                    }
+
+                    if (pick.role && pick.role !== rendered.role) {
+                        elements.role.textContent = pick.role;
+                        rendered.role = pick.role;
+                    }
+                }
+            }
+        }
+
+        function applyNotifications(notifications) {
+            // Drop notifications that would already have been hidden
+            const now = Date.now();
+            const current = [];
+            notifications.forEach((n, message) => {
+                if (now - n.time < NOTIFICATION_DURATION) {
+                    current.push(n.count > 1 ? `${message} (x${n.count})` : message);
+                }
+            });
+            if (current.length === 0) {
+                return;
+            }
+
+            const text = current.join(' · ');
+            const isError = Array.from(notifications.values())
+                .some(n => n.type === 'error' && now - n.time < NOTIFICATION_DURATION);
+
+            notificationElement.textContent = text;
+            notificationElement.className = `notification show${isError ? ' error' : ''}`;
+
+            clearTimeout(notificationTimer);
+            notificationTimer = setTimeout(() => {
+                notificationElement.classList.remove('show');
+            }, NOTIFICATION_DURATION);
+        }
+
+        // Apply everything queued since the last frame
+        function flush() {
+            frameRequested = false;
+            if (!initialized) {
+                return;
+            }
+
+            if (pendingState) {
+                const state = pendingState;
+                pendingState = null;
+                applyBans(state.bans);
+                applyPicks(state.picks);
+            }
+
+            if (pendingNotifications.size > 0) {
+                const notifications = pendingNotifications;
+                pendingNotifications = new Map();
+                applyNotifications(notifications);
+            }
+        }
+
+        return {
+            initialize: initialize,
+            render: render,
+            notify: notify,
+            flush: flush,
+        };
+    }
+
+    global.createChampSelectRenderer = createChampSelectRenderer;
+})(window);
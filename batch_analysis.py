@@ -0,0 +1,494 @@
+"""Offline batch analysis of recorded champion select session logs."""
+import argparse
+import csv
+import gzip
+import json
+import logging
+import os
+import sys
+import zlib
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+from ChampSelect import ChampSelect
+from config import (
+    APP_NAME, TEAM_SIZE, MAX_BANS, BLUE_TEAM, RED_TEAM,
+    BATCH_LOG_PATTERNS, BATCH_OUTPUT_FORMATS, BATCH_WRITE_CHUNK_SIZE,
+    BATCH_MAX_CHUNK_SIZE, BATCH_TASKS_PER_WORKER
+)
+
+# Parquet output is optional, only available when pyarrow is installed
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+TEAM_NAMES = {BLUE_TEAM: 'blue', RED_TEAM: 'red'}
+
+DRAFT_COLUMNS: List[str] = (
+    ['source', 'draft_index', 'game_id', 'draft_type', 'my_side',
+     'completed', 'num_banned', 'num_picked']
+    + [f'ban_{i}' for i in range(MAX_BANS)]
+    + [
+        f'{TEAM_NAMES[team]}_{slot}_{field}'
+        for team in (BLUE_TEAM, RED_TEAM)
+        for slot in range(TEAM_SIZE)
+        for field in ('champion_id', 'role')
+    ]
+)
+
+
+def _open_log(path: Path) -> IO[str]:
+    """Open a recorded log file for streaming, transparently handling gzip."""
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def _parse_event(line: str) -> Optional[Tuple[str, Any]]:
+    """
+    Parse a single recorded line into an (event_type, data) pair.
+
+    Lines are either raw LCU websocket payloads (``{"eventType", "uri",
+    "data"}``) or bare session objects, which are treated as updates.
+    Leading text before the JSON body (e.g. a logging prefix) is ignored.
+    """
+    start = line.find('{')
+    if start < 0:
+        return None
+    try:
+        payload = json.loads(line[start:])
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+
+    if 'eventType' in payload:
+        return payload['eventType'], payload.get('data')
+    if 'actions' in payload:
+        return 'Update', payload
+    return None
+
+
+def iter_events(path: Path) -> Iterator[Optional[Tuple[str, Any]]]:
+    """Stream events from a recorded log file, yielding None for malformed lines."""
+    with _open_log(path) as f:
+        for line in f:
+            if line.strip():
+                yield _parse_event(line)
+
+
+def _draft_row(champ_select: ChampSelect, source: str, draft_index: int,
+               game_id: Optional[int]) -> Dict[str, Any]:
+    """Flatten the current champion select state into an output row."""
+    row: Dict[str, Any] = {
+        'source': source,
+        'draft_index': draft_index,
+        'game_id': game_id,
+        'draft_type': champ_select.draft_type,
+        'my_side': champ_select.my_side,
+        'completed': champ_select.num_picked > 9,
+        'num_banned': champ_select.num_banned,
+        'num_picked': champ_select.num_picked,
+    }
+    for i, champion_id in enumerate(champ_select.bans):
+        row[f'ban_{i}'] = champion_id
+    for team in (BLUE_TEAM, RED_TEAM):
+        for slot, pick in enumerate(champ_select.picks[team]):
+            prefix = f'{TEAM_NAMES[team]}_{slot}'
+            row[f'{prefix}_champion_id'] = pick['champion_id']
+            row[f'{prefix}_role'] = pick['role']
+    return row
+
+
+def _empty_stats() -> Dict[str, Any]:
+    """Return an empty statistics accumulator."""
+    return {
+        'files': 0,
+        'events': 0,
+        'malformed': 0,
+        'drafts': 0,
+        'completed_drafts': 0,
+        'draft_types': Counter(),
+        'picks': Counter(),
+        'bans': Counter(),
+    }
+
+
+def _merge_stats(total: Dict[str, Any], part: Dict[str, Any]) -> None:
+    """Merge a per-file statistics accumulator into the running total."""
+    for key, value in part.items():
+        if isinstance(value, Counter):
+            total[key].update(value)
+        else:
+            total[key] += value
+
+
+def process_file(path: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Replay one recorded session log through ChampSelect.
+
+    Events are handled the same way as LCUHandlerWeb: Create and Delete
+    reset the state, Update feeds ChampSelect.update. Text logs from the
+    app record Create and Delete as plain messages with no JSON, so an
+    update whose gameId differs from the current draft's also starts a new
+    draft. Each draft that became active is recorded when it is reset or
+    at end of file.
+
+    A reconnect resets the session mid-draft, so the same game can be
+    recorded more than once. Within a file, the last row recorded for a
+    game_id replaces earlier ones and keeps the position of the first;
+    rows without a game_id are never merged. Statistics are computed from
+    the deduplicated rows.
+
+    Args:
+        path: Path to the recorded log file
+
+    Returns:
+        Tuple of (rows, stats) where rows are flattened drafts and stats is
+        the statistics accumulator for this file
+    """
+    log_path = Path(path)
+    source = str(log_path)
+    champ_select = ChampSelect()
+    drafts: Dict[Any, Dict[str, Any]] = {}
+    stats = _empty_stats()
+    stats['files'] = 1
+    game_id: Optional[int] = None
+
+    def flush() -> None:
+        """Record the current draft, if any, and reset state."""
+        nonlocal game_id
+        if champ_select.draft_type is not None:
+            key = game_id if game_id is not None else ('draft', len(drafts))
+            drafts[key] = _draft_row(champ_select, source, 0, game_id)
+        champ_select.reset()
+        game_id = None
+
+    try:
+        for event in iter_events(log_path):
+            if event is None:
+                stats['malformed'] += 1
+                continue
+
+            event_type, data = event
+            if event_type in ('Create', 'Delete'):
+                flush()
+            elif event_type == 'Update':
+                session_game_id = data.get('gameId') if isinstance(data, dict) else None
+                if session_game_id and game_id is not None and session_game_id != game_id:
+                    flush()
+                try:
+                    champ_select.update(data)
+                except (KeyError, IndexError, TypeError):
+                    stats['malformed'] += 1
+                    continue
+                if game_id is None and session_game_id:
+                    game_id = session_game_id
+            # Each line counts as either an event or malformed, never both
+            stats['events'] += 1
+    except (OSError, EOFError, UnicodeDecodeError, zlib.error) as e:
+        logger.error(f"Failed to read {source}: {e}")
+
+    flush()
+
+    rows = list(drafts.values())
+    for draft_index, row in enumerate(rows):
+        row['draft_index'] = draft_index
+        stats['drafts'] += 1
+        stats['completed_drafts'] += int(row['completed'])
+        stats['draft_types'][row['draft_type']] += 1
+        stats['bans'].update(row[f'ban_{i}'] for i in range(MAX_BANS) if row[f'ban_{i}'])
+        stats['picks'].update(
+            row[f'{TEAM_NAMES[team]}_{slot}_champion_id']
+            for team in (BLUE_TEAM, RED_TEAM)
+            for slot in range(TEAM_SIZE)
+            if row[f'{TEAM_NAMES[team]}_{slot}_champion_id']
+        )
+    return rows, stats
+
+
+class JsonlDraftWriter:
+    """Write draft rows as JSON lines."""
+
+    def __init__(self, path: Path):
+        """Open the output file."""
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Write a batch of draft rows."""
+        self.file.writelines(json.dumps(row) + '\n' for row in rows)
+
+    def close(self) -> None:
+        """Flush and close the output file."""
+        self.file.close()
+
+
+class CsvDraftWriter:
+    """Write draft rows as CSV with a fixed header."""
+
+    def __init__(self, path: Path):
+        """Open the output file and write the header."""
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.writer = csv.DictWriter(self.file, fieldnames=DRAFT_COLUMNS)
+        self.writer.writeheader()
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Write a batch of draft rows."""
+        self.writer.writerows(rows)
+
+    def close(self) -> None:
+        """Flush and close the output file."""
+        self.file.close()
+
+
+class ParquetDraftWriter:
+    """Write draft rows as Parquet, one row group per buffered chunk."""
+
+    def __init__(self, path: Path, chunk_size: int = BATCH_WRITE_CHUNK_SIZE):
+        """Open the Parquet writer with the fixed draft schema."""
+        if not PARQUET_AVAILABLE:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)")
+        self.chunk_size = chunk_size
+        self.buffer: List[Dict[str, Any]] = []
+        self.schema = pa.schema(
+            [(name, _parquet_type(name)) for name in DRAFT_COLUMNS]
+        )
+        self.writer = pq.ParquetWriter(str(path), self.schema)
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Write a batch of draft rows."""
+        self.buffer.extend(rows)
+        if len(self.buffer) >= self.chunk_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write buffered rows as a single row group."""
+        if self.buffer:
+            table = pa.Table.from_pylist(self.buffer, schema=self.schema)
+            self.writer.write_table(table)
+            self.buffer = []
+
+    def close(self) -> None:
+        """Flush and close the output file."""
+        self._flush()
+        self.writer.close()
+
+
+def _parquet_type(column: str):
+    """Return the pyarrow type for an output column."""
+    if column in ('source', 'draft_type') or column.endswith('_role'):
+        return pa.string()
+    if column == 'completed':
+        return pa.bool_()
+    return pa.int64()
+
+
+WRITERS = {
+    'jsonl': JsonlDraftWriter,
+    'csv': CsvDraftWriter,
+    'parquet': ParquetDraftWriter,
+}
+
+
+def find_log_files(inputs: Iterable[str], patterns: Iterable[str] = BATCH_LOG_PATTERNS) -> List[str]:
+    """Expand input files and directories into a sorted list of log files."""
+    files = set()
+    for entry in inputs:
+        path = Path(entry)
+        if path.is_dir():
+            for pattern in patterns:
+                files.update(str(p) for p in path.rglob(pattern) if p.is_file())
+        elif path.is_file():
+            files.add(str(path))
+        else:
+            logger.warning(f"Input {entry} does not exist")
+    return sorted(files)
+
+
+def infer_format(output: str) -> str:
+    """Infer the output format from the output file extension."""
+    suffix = Path(output).suffix.lstrip('.').lower()
+    return suffix if suffix in BATCH_OUTPUT_FORMATS else 'jsonl'
+
+
+def process_files(paths: List[str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Process a chunk of log files in one worker task."""
+    rows: List[Dict[str, Any]] = []
+    stats = _empty_stats()
+    for path in paths:
+        file_rows, file_stats = process_file(path)
+        rows.extend(file_rows)
+        _merge_stats(stats, file_stats)
+    return rows, stats
+
+
+def run_batch(files: List[str], writer, workers: int,
+              chunksize: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Process log files across a process pool and stream rows to a writer.
+
+    Files are the unit of work, since each one holds ordered session
+    events; they are handed to workers in chunks of ``chunksize``. At most
+    BATCH_TASKS_PER_WORKER chunks per worker are in flight, and rows are
+    written as soon as each chunk finishes, so memory is bounded by the
+    in-flight chunks rather than the size of the archive. Rows are written
+    in completion order, not input order.
+    """
+    stats = _empty_stats()
+    if chunksize is None:
+        chunksize = max(1, min(BATCH_MAX_CHUNK_SIZE, len(files) // (workers * 4)))
+    chunks = (files[i:i + chunksize] for i in range(0, len(files), chunksize))
+
+    if workers <= 1:
+        for rows, chunk_stats in map(process_files, chunks):
+            writer.write_rows(rows)
+            _merge_stats(stats, chunk_stats)
+        return stats
+
+    max_in_flight = workers * BATCH_TASKS_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for chunk in chunks:
+            pending.add(executor.submit(process_files, chunk))
+            if len(pending) < max_in_flight:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                rows, chunk_stats = future.result()
+                writer.write_rows(rows)
+                _merge_stats(stats, chunk_stats)
+
+        for future in as_completed(pending):
+            rows, chunk_stats = future.result()
+            writer.write_rows(rows)
+            _merge_stats(stats, chunk_stats)
+    return stats
+
+
+def _stats_summary(stats: Dict[str, Any], top: int = 20) -> Dict[str, Any]:
+    """Convert a statistics accumulator into a JSON-serialisable summary."""
+    return {
+        'files': stats['files'],
+        'events': stats['events'],
+        'malformed': stats['malformed'],
+        'drafts': stats['drafts'],
+        'completed_drafts': stats['completed_drafts'],
+        'draft_types': dict(stats['draft_types']),
+        'top_picks': stats['picks'].most_common(top),
+        'top_bans': stats['bans'].most_common(top),
+        'picks': {str(k): v for k, v in stats['picks'].items()},
+        'bans': {str(k): v for k, v in stats['bans'].items()},
+    }
+
+
+def self_check() -> bool:
+    """
+    Check that drafts not separated by Create/Delete lines are split.
+
+    Writes two complete drafts in the LCUHandlerWeb debug-log format, where
+    Create and Delete are plain messages with no JSON, and checks that both
+    come back as separate rows with their own game_id.
+    """
+    import random
+    import tempfile
+    from draft_fuzz import generate_draft
+
+    rng = random.Random(0)
+    drafts = [generate_draft(rng), generate_draft(rng, tournament=True)]
+    prefix = '2024-01-01 00:00:00,000 - app - '
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'session.log'
+        with open(path, 'w', encoding='utf-8') as f:
+            for snapshots in drafts:
+                f.write(f"{prefix}INFO - Champion select session created\n")
+                f.write(f"{prefix}DEBUG - Session data: {json.dumps(snapshots[0])}\n")
+                for snapshot in snapshots:
+                    f.write(f"{prefix}DEBUG - Session update: {json.dumps(snapshot)}\n")
+                f.write(f"{prefix}INFO - Champion select session ended\n")
+        rows, _ = process_file(str(path))
+
+    expected = [snapshots[0]['gameId'] for snapshots in drafts]
+    actual = [row['game_id'] for row in rows]
+    if actual != expected or not all(row['completed'] for row in rows):
+        print(f"❌ Expected completed drafts {expected}, got {actual}")
+        return False
+    print(f"✅ Split {len(rows)} drafts without Create/Delete events")
+    return True
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command line integer that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def main():
+    """Batch analysis entry point."""
+    parser = argparse.ArgumentParser(
+        description=f"{APP_NAME} batch analysis of recorded champion select logs"
+    )
+    parser.add_argument('inputs', nargs='*', help='Log files or directories to process')
+    parser.add_argument('-o', '--output', help='Output file for draft rows')
+    parser.add_argument('--format', choices=BATCH_OUTPUT_FORMATS,
+                        help='Output format (default: inferred from output extension)')
+    parser.add_argument('--stats', help='Write aggregated statistics as JSON to this file')
+    parser.add_argument('--workers', type=_positive_int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: all cores)')
+    parser.add_argument('--chunksize', type=_positive_int, help='Files handed to a worker at a time')
+    parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+    parser.add_argument('--self-check', action='store_true',
+                        help='Check that drafts without Create/Delete lines are split')
+    args = parser.parse_args()
+
+    if args.self_check:
+        sys.exit(0 if self_check() else 1)
+    if not args.inputs or not args.output:
+        parser.error('inputs and --output are required')
+
+    logging.basicConfig(
+        level=logging.INFO if args.debug else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    files = find_log_files(args.inputs)
+    if not files:
+        logger.error("No log files found")
+        sys.exit(1)
+
+    output_format = args.format or infer_format(args.output)
+    try:
+        writer = WRITERS[output_format](Path(args.output))
+    except RuntimeError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    logger.info(f"Processing {len(files)} files with {args.workers} workers")
+    try:
+        stats = run_batch(files, writer, args.workers, args.chunksize)
+    finally:
+        writer.close()
+
+    summary = _stats_summary(stats)
+    if args.stats:
+        with open(args.stats, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+
+    print(f"📊 Files: {summary['files']} | Events: {summary['events']} | "
+          f"Malformed: {summary['malformed']}")
+    print(f"🎮 Drafts: {summary['drafts']} ({summary['completed_drafts']} completed)")
+    print(f"💾 Output: {args.output} ({output_format})")
+
+
+if __name__ == '__main__':
+    main()
@@ -42,7 +42,7 @@ echo "Creating portable distribution..."
 mkdir -p dist/league-phd-portable/
 cp -r templates/ dist/league-phd-portable/
 cp -r assets/ dist/league-phd-portable/
-cp app.py ChampSelect.py config.py lcu_handler_web.py mock_lcu_handler.py dist/league-phd-portable/
+cp app.py batch_analysis.py ChampSelect.py config.py lcu_handler_web.py mock_lcu_handler.py dist/league-phd-portable/
 cp requirements_web.txt dist/league-phd-portable/
 cp install_and_run.* run.* dist/league-phd-portable/
 cp README.md LICENSE dist/league-phd-portable/
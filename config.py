@@ -36,3 +36,10 @@ DRAFT_TYPE_TOURNAMENT = 'tournament'
 
 # LCU API endpoints
 LCU_CHAMP_SELECT_SESSION = '/lol-champ-select/v1/session'
+
+# Batch analysis settings
+BATCH_LOG_PATTERNS = ('*.log', '*.jsonl', '*.log.gz', '*.jsonl.gz')
+BATCH_OUTPUT_FORMATS = ('jsonl', 'csv', 'parquet')
+BATCH_WRITE_CHUNK_SIZE = 1000
+BATCH_MAX_CHUNK_SIZE = 64
+BATCH_TASKS_PER_WORKER = 2
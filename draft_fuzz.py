@@ -0,0 +1,448 @@
+"""Seeded fuzz and throughput harness for champion select update engines.
+
+Generates valid and adversarial LCU session sequences (duplicates, drops,
+reordering, reconnects, post-completion events, multiple drafts per stream,
+tournament layouts) and checks that a candidate
+update engine stays equivalent to the reference ChampSelect after every event.
+"""
+import copy
+import importlib
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ChampSelect import ChampSelect
+from config import APP_NAME, TEAM_SIZE, BLUE_TEAM, RED_TEAM
+
+# A session dict is an LCU update; None stands for a session reset (Create/Delete)
+Event = Optional[Dict[str, Any]]
+
+POSITIONS = ['top', 'jungle', 'middle', 'bottom', 'utility']
+CHAMPION_IDS = list(range(1, 170))
+
+# Turn layouts as lists of action groups, each action is (type, side).
+# Solo/flex queue bans are one simultaneous group of ten, which is how
+# ChampSelect tells it apart from tournament draft.
+SOLO_LAYOUT: List[List[Tuple[str, int]]] = (
+    [[('ban', BLUE_TEAM)] * TEAM_SIZE + [('ban', RED_TEAM)] * TEAM_SIZE]
+    + [[('pick', BLUE_TEAM)]]
+    + [[('pick', RED_TEAM)] * 2, [('pick', BLUE_TEAM)] * 2] * 2
+    + [[('pick', RED_TEAM)]]
+)
+
+TOURNAMENT_LAYOUT: List[List[Tuple[str, int]]] = (
+    [[('ban', BLUE_TEAM)], [('ban', RED_TEAM)]] * 3
+    + [[('pick', BLUE_TEAM)], [('pick', RED_TEAM)] * 2, [('pick', BLUE_TEAM)] * 2, [('pick', RED_TEAM)]]
+    + [[('ban', RED_TEAM)], [('ban', BLUE_TEAM)]] * 2
+    + [[('pick', RED_TEAM)], [('pick', BLUE_TEAM)] * 2, [('pick', RED_TEAM)]]
+)
+
+ADVERSARIAL_MUTATIONS = ('duplicate', 'drop', 'swap', 'stale', 'reconnect')
+
+
+def _build_actions(layout: List[List[Tuple[str, int]]]) -> List[List[Dict[str, Any]]]:
+    """Build the (not yet completed) action list for a draft layout."""
+    next_cell = {
+        'ban': {BLUE_TEAM: 0, RED_TEAM: 0},
+        'pick': {BLUE_TEAM: 0, RED_TEAM: 0},
+    }
+    actions = []
+    action_id = 0
+    for group in layout:
+        action_group = []
+        for action_type, side in group:
+            slot = next_cell[action_type][side] % TEAM_SIZE
+            next_cell[action_type][side] += 1
+            action_group.append({
+                'id': action_id,
+                'type': action_type,
+                'actorCellId': slot if side == BLUE_TEAM else slot + TEAM_SIZE,
+                'championId': 0,
+                'completed': False,
+                'isInProgress': False,
+                'isAllyAction': False,
+            })
+            action_id += 1
+        actions.append(action_group)
+    return actions
+
+
+def generate_draft(rng: random.Random, tournament: bool = False) -> List[Dict[str, Any]]:
+    """
+    Generate the clean, in-order session snapshots of one complete draft.
+
+    Each action is first shown in progress (hovering a champion), then
+    completed. Champions are unique across the draft, except that bans may
+    be skipped with champion 0 as the client allows.
+    """
+    layout = TOURNAMENT_LAYOUT if tournament else SOLO_LAYOUT
+    actions = _build_actions(layout)
+    local_cell = rng.randrange(2 * TEAM_SIZE)
+    local_side = BLUE_TEAM if local_cell < TEAM_SIZE else RED_TEAM
+    positions = POSITIONS.copy()
+    rng.shuffle(positions)
+    champions = rng.sample(CHAMPION_IDS, 20)
+
+    for action in (a for group in actions for a in group):
+        action_side = BLUE_TEAM if action['actorCellId'] < TEAM_SIZE else RED_TEAM
+        action['isAllyAction'] = action_side == local_side
+
+    session = {
+        'gameId': rng.randrange(1, 10 ** 10),
+        'hasSimultaneousPicks': False,
+        'localPlayerCellId': local_cell,
+        'myTeam': [
+            {'cellId': i + (TEAM_SIZE if local_side == RED_TEAM else 0), 'assignedPosition': positions[i]}
+            for i in range(TEAM_SIZE)
+        ],
+        'actions': actions,
+    }
+
+    snapshots = [copy.deepcopy(session)]
+    for group in actions:
+        order = list(group)
+        # Simultaneous actions within a group complete in any order
+        rng.shuffle(order)
+        for action in order:
+            action['isInProgress'] = True
+            action['championId'] = champions.pop()
+            snapshots.append(copy.deepcopy(session))
+
+            action['isInProgress'] = False
+            action['completed'] = True
+            if action['type'] == 'ban' and rng.random() < 0.05:
+                action['championId'] = 0
+            snapshots.append(copy.deepcopy(session))
+    return snapshots
+
+
+def mutate(rng: random.Random, snapshots: List[Dict[str, Any]], mutations: int) -> List[Event]:
+    """
+    Apply adversarial delivery faults to a clean snapshot sequence.
+
+    Faults model what reconnects and out-of-order websocket delivery can
+    produce. The final snapshot is always delivered last, so a monotonic
+    engine must converge to the clean final state.
+    """
+    events: List[Event] = list(snapshots[:-1])
+    for _ in range(mutations):
+        if not events:
+            break
+        kind = rng.choice(ADVERSARIAL_MUTATIONS)
+        i = rng.randrange(len(events))
+        if kind == 'duplicate':
+            events.insert(i, events[i])
+        elif kind == 'drop':
+            del events[i]
+        elif kind == 'swap' and i + 1 < len(events):
+            events[i], events[i + 1] = events[i + 1], events[i]
+        elif kind == 'stale':
+            # Re-deliver an older snapshot later in the stream
+            events.insert(rng.randrange(i, len(events) + 1), events[i])
+        elif kind == 'reconnect' and events[i] is not None:
+            # Reconnect: session reset followed by the current session
+            events[i + 1:i + 1] = [None, events[i]]
+    events.append(snapshots[-1])
+    return events
+
+
+def post_completion_tail(rng: random.Random, snapshots: List[Dict[str, Any]]) -> List[Event]:
+    """
+    Generate events delivered after a draft has completed.
+
+    The client keeps sending the finished session during finalization, and
+    reconnects can re-deliver older snapshots after it.
+    """
+    tail: List[Event] = []
+    for _ in range(rng.randint(1, 4)):
+        if rng.random() < 0.5:
+            tail.append(snapshots[-1])
+        else:
+            tail.append(rng.choice(snapshots[:-1]))
+    return tail
+
+
+def generate_case(seed: int, index: int) -> Tuple[str, List[Event], List[Tuple[int, Dict[str, Any]]]]:
+    """
+    Generate one deterministic fuzz case.
+
+    A case is a stream of one or more drafts separated by session resets.
+    Each draft is delivered clean or with adversarial faults, and may be
+    followed by post-completion events.
+
+    Returns:
+        Tuple of (kind, events, checkpoints) where each checkpoint is the
+        index of a draft's final snapshot in events and the reference state
+        after that draft's clean sequence. Checkpoints are only given for
+        adversarial drafts, which must converge by that point.
+    """
+    rng = random.Random(f'{seed}:{index}')
+    num_drafts = rng.randint(2, 3) if rng.random() < 0.25 else 1
+    simultaneous = rng.random() < 0.05
+
+    events: List[Event] = []
+    checkpoints: List[Tuple[int, Dict[str, Any]]] = []
+    kinds = []
+    has_tail = False
+    for draft in range(num_drafts):
+        if draft > 0:
+            events.append(None)
+
+        tournament = rng.random() < 0.3
+        snapshots = generate_draft(rng, tournament)
+        layout = 'tournament' if tournament else 'solo'
+
+        if rng.random() < 0.2:
+            kinds.append(layout)
+            events.extend(snapshots)
+        else:
+            kinds.append('adversarial-' + layout)
+            events.extend(mutate(rng, snapshots, rng.randint(1, 8)))
+            reference = ChampSelect()
+            for snapshot in snapshots:
+                reference.update(snapshot)
+            checkpoints.append((len(events) - 1, copy.deepcopy(reference.__repr__())))
+
+        if rng.random() < 0.3:
+            has_tail = True
+            events.extend(post_completion_tail(rng, snapshots))
+
+    if simultaneous:
+        # Blind pick sessions must never activate the engine
+        for event in events:
+            if event is not None:
+                event['hasSimultaneousPicks'] = True
+        return 'simultaneous', events, []
+
+    kind = kinds[0] if num_drafts == 1 else f'multi-{num_drafts}'
+    if has_tail:
+        kind += '+tail'
+    return kind, events, checkpoints
+
+
+def _replay(engine: Any, events: List[Event]) -> Tuple[List[Tuple[Any, Dict[str, Any]]], Optional[Exception]]:
+    """
+    Feed events to an engine, returning the update result and state after each.
+
+    ChampSelect.__repr__ exposes its live pick and ban lists, which later
+    updates modify in place, so each result is copied when it is recorded.
+    If the engine raises, replay stops and the exception is returned with
+    the results recorded so far; its event index is len(results).
+    """
+    results = []
+    for event in events:
+        try:
+            if event is None:
+                engine.reset()
+                update = None
+            else:
+                update = engine.update(event)
+            results.append(copy.deepcopy((update, engine.__repr__())))
+        except Exception as e:
+            return results, e
+    return results, None
+
+
+def _timed_replay(engine: Any, events: List[Event]) -> float:
+    """Feed events to an engine without recording results, returning elapsed time."""
+    start = time.perf_counter()
+    for event in events:
+        if event is None:
+            engine.reset()
+        else:
+            engine.update(event)
+    return time.perf_counter() - start
+
+
+def check_case(engine_factory: Callable[[], Any], seed: int, index: int) -> Dict[str, Any]:
+    """
+    Run one case through the reference and candidate engines.
+
+    Returns:
+        Dictionary with case kind, event count, timings and the first
+        mismatch found (or None)
+    """
+    kind, events, checkpoints = generate_case(seed, index)
+    reference_results, reference_error = _replay(ChampSelect(), copy.deepcopy(events))
+    if reference_error is not None:
+        raise reference_error
+    candidate_results, candidate_error = _replay(engine_factory(), copy.deepcopy(events))
+
+    mismatch = None
+    for i, (expected, actual) in enumerate(zip(reference_results, candidate_results)):
+        if expected != actual:
+            mismatch = {'event': i, 'expected': expected, 'actual': actual}
+            break
+
+    if mismatch is None and candidate_error is not None:
+        # A crashing engine is a failure, reported at the event that raised
+        event = len(candidate_results)
+        mismatch = {
+            'event': event,
+            'expected': reference_results[event],
+            'actual': None,
+            'reason': repr(candidate_error),
+        }
+
+    # Reconnects leave the engine reset mid-draft, which is only as good as
+    # the snapshots delivered afterwards; compare picks and bans only, and
+    # only up to each draft's final snapshot, before any post-completion events
+    for event, expected_final in checkpoints:
+        if mismatch is not None:
+            break
+        state = reference_results[event][1]
+        for key in ('bans', 'picks', 'num_banned'):
+            if state[key] != expected_final[key]:
+                mismatch = {
+                    'event': event,
+                    'expected': {key: expected_final[key]},
+                    'actual': {key: state[key]},
+                    'reason': 'reference did not converge',
+                }
+                break
+
+    # Time the engines separately from result recording and comparison
+    reference_time = _timed_replay(ChampSelect(), events)
+    # A crashed candidate is not timed, so its rate only covers cases that completed
+    candidate_time = _timed_replay(engine_factory(), events) if candidate_error is None else 0.0
+
+    return {
+        'kind': kind,
+        'events': len(events),
+        'reference_time': reference_time,
+        'candidate_time': candidate_time,
+        'mismatch': mismatch,
+    }
+
+
+class EarlyPickChampSelect(ChampSelect):
+    """
+    Known-bad engine that shows in-progress (hovered) picks as already made.
+
+    Update results match the reference, and the hovered champion is the one
+    later locked in, so the final state matches too; only the pick state
+    between events differs. Used by --self-check to confirm the harness
+    compares the state after every event.
+    """
+
+    def __init__(self):
+        """Initialize with no hovered slots."""
+        super().__init__()
+        self.hovered: List[Tuple[int, int]] = []
+
+    def reset(self) -> None:
+        """Reset state and forget hovered slots."""
+        super().reset()
+        self.hovered = []
+
+    def update(self, session: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+        """Update like the reference, then fill empty slots from hovered picks."""
+        # Clear hovered slots so the reference logic sees its own state
+        for team, slot in self.hovered:
+            self.picks[team][slot] = {'champion_id': None, 'role': None}
+        self.hovered = []
+
+        result = super().update(session)
+
+        if self.has_pick_started:
+            for action in self._get_action_by_type(session['actions'], 'pick'):
+                team = self._determine_my_side(action['actorCellId'])
+                slot = action['actorCellId'] % TEAM_SIZE
+                if (action['isInProgress'] and action['championId']
+                        and self.picks[team][slot]['champion_id'] is None):
+                    role = self._get_player_role(session, action['actorCellId']) if action['isAllyAction'] else None
+                    self.picks[team][slot] = {'champion_id': action['championId'], 'role': role}
+                    self.hovered.append((team, slot))
+        return result
+
+
+def load_engine(spec: str) -> Callable[[], Any]:
+    """Load an engine factory from a 'module:attribute' specification."""
+    module_name, _, attribute = spec.partition(':')
+    if not attribute:
+        raise ValueError(f"Engine must be given as module:attribute, got {spec!r}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def run(engine_factory: Callable[[], Any], seed: int, cases: int,
+        start: int = 0, max_failures: int = 5) -> Dict[str, Any]:
+    """Run a range of fuzz cases and aggregate the results."""
+    summary: Dict[str, Any] = {
+        'cases': 0,
+        'events': 0,
+        'kinds': {},
+        'reference_time': 0.0,
+        'candidate_time': 0.0,
+        'failures': [],
+    }
+    for index in range(start, start + cases):
+        result = check_case(engine_factory, seed, index)
+        summary['cases'] += 1
+        summary['events'] += result['events']
+        summary['kinds'][result['kind']] = summary['kinds'].get(result['kind'], 0) + 1
+        summary['reference_time'] += result['reference_time']
+        summary['candidate_time'] += result['candidate_time']
+        if result['mismatch'] is not None:
+            summary['failures'].append({'case': index, 'kind': result['kind'], **result['mismatch']})
+            if len(summary['failures']) >= max_failures:
+                break
+    return summary
+
+
+def main():
+    """Fuzz harness entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=f"{APP_NAME} champion select fuzz and throughput harness"
+    )
+    parser.add_argument('--engine', default='ChampSelect:ChampSelect',
+                        help='Candidate engine as module:attribute (default: reference ChampSelect)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--cases', type=int, default=1000, help='Number of cases to run')
+    parser.add_argument('--case', type=int, help='Run only this case index (for reproducing failures)')
+    parser.add_argument('--max-failures', type=int, default=5, help='Stop after this many failures')
+    parser.add_argument('--self-check', action='store_true',
+                        help='Check that a known-bad engine (picks written early) is caught')
+    args = parser.parse_args()
+
+    if args.self_check:
+        summary = run(EarlyPickChampSelect, args.seed, args.cases, max_failures=1)
+        if not summary['failures']:
+            print(f"❌ Known-bad engine passed {summary['cases']} cases")
+            sys.exit(1)
+        failure = summary['failures'][0]
+        print(f"✅ Known-bad engine caught at case {failure['case']} event {failure['event']}")
+        return
+
+    engine_factory = load_engine(args.engine)
+    if args.case is not None:
+        summary = run(engine_factory, args.seed, 1, start=args.case, max_failures=args.max_failures)
+    else:
+        summary = run(engine_factory, args.seed, args.cases, max_failures=args.max_failures)
+
+    events = summary['events']
+    print(f"🎲 Seed: {args.seed} | Cases: {summary['cases']} | Events: {events}")
+    print(f"📋 Kinds: {', '.join(f'{k}={v}' for k, v in sorted(summary['kinds'].items()))}")
+    for name in ('reference', 'candidate'):
+        elapsed = summary[f'{name}_time']
+        if elapsed > 0:
+            print(f"⚡ {name.capitalize()}: {events / elapsed:,.0f} events/s ({elapsed * 1000:.1f} ms)")
+        else:
+            print(f"⚡ {name.capitalize()}: n/a (no case completed)")
+
+    if summary['failures']:
+        for failure in summary['failures']:
+            print(f"❌ Case {failure['case']} ({failure['kind']}) event {failure['event']}: "
+                  f"{failure.get('reason', 'state mismatch')}")
+            print(f"   expected: {failure['expected']}")
+            print(f"   actual:   {failure['actual']}")
+        print(f"   Reproduce with: --seed {args.seed} --case {summary['failures'][0]['case']}")
+        sys.exit(1)
+
+    print("✅ All cases matched the reference")
+
+
+if __name__ == '__main__':
+    main()